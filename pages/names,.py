@@ -1,20 +1,33 @@
 # pages/names.py
+import io
 import datetime as dt
+from urllib.parse import urlencode
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import dash
 from dash import html, dcc, Input, Output
 import dash.dash_table as dash_table
 import plotly.express as px
+from flask import Response, abort, request, stream_with_context
 
 from fetch_data import get_names_df
 
 dash.register_page(__name__, path="/names", name="Names")
+app    = dash.get_app()
+server = app.server
+
+EXPORT_CHUNK_ROWS = 10_000          # rows per CSV chunk / Parquet row group
 
 # ────────────────────────────────────────────────────────────────────────────
 # Load once into memory (refresh when the server restarts)
 # ────────────────────────────────────────────────────────────────────────────
 names_df: pd.DataFrame = get_names_df()
 
+# Arrow schema for the Parquet export – inferring it converts every object
+# column, so do it once here rather than per download
+_EXPORT_SCHEMA = pa.Schema.from_pandas(names_df, preserve_index=False)
+
 # Last-refresh time (for the little caption)
 _LAST_REFRESH = dt.datetime.utcfromtimestamp(
     names_df.attrs.get("file_mtime", dt.datetime.utcnow()).timestamp()
@@ -77,6 +90,17 @@ def layout() -> html.Div:
             dcc.Graph(id="age-hist",  figure=age_fig),
 
             html.H4("Browse full table (filtered)"),
+            html.Div(
+                [
+                    html.A("Download CSV", id="export-csv",
+                           href=dash.get_relative_path("/names/export.csv"),
+                           download=""),
+                    html.A("Download Parquet", id="export-parquet",
+                           href=dash.get_relative_path("/names/export.parquet"),
+                           download=""),
+                ],
+                style={"display": "flex", "gap": "16px", "margin": "0 0 10px"},
+            ),
             dash_table.DataTable(
                 id="names-table",
                 columns=[
@@ -107,16 +131,7 @@ def layout() -> html.Div:
     Input("name-search",  "value"),
 )
 def update_visuals(gender_val: str, search_text: str):
-    df = names_df.copy()
-
-    # gender filter
-    if gender_val in ("m", "f"):
-        df = df[df["sex"] == gender_val]
-
-    # name search (case-insensitive English only)
-    if search_text:
-        term = search_text.lower()
-        df = df[df["english_name"].str.lower().str.contains(term, na=False)]
+    df = names_df[_filter_mask(names_df, gender_val, search_text)]
 
     # rebuild bar + hist
     first_names = (
@@ -130,6 +145,121 @@ def update_visuals(gender_val: str, search_text: str):
     return bar_fig, age_fig, df.to_dict("records")
 
 
+@dash.callback(
+    Output("export-csv",     "href"),
+    Output("export-parquet", "href"),
+    Input("gender-filter","value"),
+    Input("name-search",  "value"),
+)
+def update_export_links(gender_val: str, search_text: str):
+    params = {"gender": gender_val or "all"}
+    if search_text:
+        params["q"] = search_text
+    query = urlencode(params)
+    return (
+        dash.get_relative_path(f"/names/export.csv?{query}"),
+        dash.get_relative_path(f"/names/export.parquet?{query}"),
+    )
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Filtering (shared by the callbacks and the export route)
+# ────────────────────────────────────────────────────────────────────────────
+def _filter_mask(df: pd.DataFrame, gender_val: str, search_text: str) -> pd.Series:
+    mask = pd.Series(True, index=df.index)
+
+    # gender filter
+    if gender_val in ("m", "f"):
+        mask &= df["sex"] == gender_val
+
+    # name search (case-insensitive English only, plain substring)
+    if search_text:
+        term = search_text.lower()
+        mask &= df["english_name"].str.lower().str.contains(
+            term, regex=False, na=False
+        )
+
+    return mask
+
+
+def _filtered_chunks(gender_val: str, search_text: str):
+    """Yield the filtered rows of *names_df* one slice at a time."""
+    for start in range(0, len(names_df), EXPORT_CHUNK_ROWS):
+        chunk = names_df.iloc[start:start + EXPORT_CHUNK_ROWS]
+        chunk = chunk[_filter_mask(chunk, gender_val, search_text)]
+        if not chunk.empty:
+            yield chunk
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Export route – streams the filtered set without building it in memory
+# ────────────────────────────────────────────────────────────────────────────
+class _StreamSink(io.RawIOBase):
+    """Write-only file object that hands back whatever was written so far."""
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        out = b"".join(self._parts)
+        self._parts.clear()
+        return out
+
+
+def _csv_stream(gender_val: str, search_text: str):
+    header = True
+    for chunk in _filtered_chunks(gender_val, search_text):
+        yield chunk.to_csv(index=False, header=header)
+        header = False
+    if header:                                  # nothing matched
+        yield names_df.iloc[:0].to_csv(index=False)
+
+
+def _parquet_stream(gender_val: str, search_text: str):
+    sink = _StreamSink()
+    with pq.ParquetWriter(sink, _EXPORT_SCHEMA) as writer:
+        for chunk in _filtered_chunks(gender_val, search_text):
+            writer.write_table(
+                pa.Table.from_pandas(
+                    chunk, schema=_EXPORT_SCHEMA, preserve_index=False
+                )
+            )
+            yield sink.drain()
+    yield sink.drain()                          # footer
+
+
+@server.route(f"{app.config.routes_pathname_prefix}names/export.<fmt>")
+def export_names(fmt: str):
+    gender_val  = request.args.get("gender", "all")
+    search_text = request.args.get("q", "")
+
+    if fmt == "csv":
+        stream, mimetype = _csv_stream(gender_val, search_text), "text/csv"
+    elif fmt == "parquet":
+        stream, mimetype = (_parquet_stream(gender_val, search_text),
+                            "application/vnd.apache.parquet")
+    else:
+        abort(404)
+
+    return Response(
+        stream_with_context(stream),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename=victims.{fmt}"},
+    )
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # Helper chart builders
 # ────────────────────────────────────────────────────────────────────────────
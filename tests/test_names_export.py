@@ -0,0 +1,93 @@
+# tests/test_names_export.py
+import io
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pd    = pytest.importorskip("pandas")
+pq    = pytest.importorskip("pyarrow.parquet")
+dash  = pytest.importorskip("dash")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="module")
+def names_page():
+    """Load the names page against a small in-memory dataset."""
+    import fetch_data
+
+    sample = pd.DataFrame({
+        "id":           range(1, 8),
+        "english_name": ["Ahmad Ali", "Sara Ali", "Omar (Abu) Said",
+                         "Mona Haddad", "Ahmad Haddad", "Lina c++", None],
+        "age":          [30, 25, None, 41, 8, 12, 50],
+        "sex":          ["m", "f", "m", "f", "m", "f", "m"],
+        "dob":          pd.to_datetime(["1993-01-01", None, None, "1982-05-05",
+                                        "2015-03-03", "2011-07-07", None]),
+        "source":       ["MoH", "MoH", "PUBLIC", "MoH", "MoH", "PUBLIC", "MoH"],
+    })
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(fetch_data, "get_names_df", lambda refresh=False: sample.copy())
+    mp.setattr(dash, "register_page", lambda *args, **kwargs: None)
+
+    app = dash.Dash(__name__)  # page module hooks its route onto get_app()
+    app.layout = dash.html.Div()   # Dash refuses to serve without a layout
+    spec = importlib.util.spec_from_file_location(
+        "names_page", ROOT / "pages" / "names,.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.EXPORT_CHUNK_ROWS = 2   # force several chunks on the tiny sample
+
+    yield module
+    mp.undo()
+
+
+@pytest.mark.parametrize("gender, q", [
+    ("all", ""),
+    ("m",   "ahmad"),
+    ("f",   "c++"),
+    ("all", "(a+)+$"),         # regex metacharacters → plain substring
+    ("f",   "nobody"),
+])
+def test_csv_export_matches_filter(names_page, gender, q):
+    client = names_page.server.test_client()
+    resp = client.get("/names/export.csv", query_string={"gender": gender, "q": q})
+    assert resp.status_code == 200
+
+    text = resp.get_data(as_text=True)
+    assert text.count("id,english_name") == 1
+
+    expected = names_page.names_df[
+        names_page._filter_mask(names_page.names_df, gender, q)
+    ]
+    got = pd.read_csv(io.StringIO(text))
+    assert list(got.columns) == list(names_page.names_df.columns)
+    assert got["id"].tolist() == expected["id"].tolist()
+
+
+@pytest.mark.parametrize("gender, q", [
+    ("all", ""),
+    ("m",   "haddad"),
+    ("f",   "nobody"),
+])
+def test_parquet_export_round_trips(names_page, gender, q):
+    client = names_page.server.test_client()
+    resp = client.get("/names/export.parquet",
+                      query_string={"gender": gender, "q": q})
+    assert resp.status_code == 200
+
+    got = pq.read_table(io.BytesIO(resp.get_data())).to_pandas()
+    expected = names_page.names_df[
+        names_page._filter_mask(names_page.names_df, gender, q)
+    ].reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+
+def test_unknown_format_is_404(names_page):
+    client = names_page.server.test_client()
+    assert client.get("/names/export.xlsx").status_code == 404